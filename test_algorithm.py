@@ -3,10 +3,15 @@
 Simple test to verify the Tower of Hanoi algorithm is working correctly.
 """
 
-from tower_of_hanoi import hanoi_solver, PegName, GameState
+from itertools import permutations
+
+from tower_of_hanoi import (
+    hanoi_moves, get_hanoi_moves,
+    Move, PegName, GameState, validate_move_sequence
+)
 
 def test_hanoi_algorithm():
-    """Test the hanoi_solver algorithm for correctness."""
+    """Test the solver algorithm for correctness."""
     
     for n in [3, 4, 5, 20]:  # Test with 3, 4, 5, and 20 disks
         print(f"\nTesting with {n} disks:")
@@ -15,7 +20,7 @@ def test_hanoi_algorithm():
         game_state = GameState(n)
         
         # Generate solution moves
-        moves = list(hanoi_solver(n, PegName.SOURCE, PegName.DESTINATION, PegName.AUXILIARY))
+        moves = get_hanoi_moves(n, PegName.SOURCE, PegName.DESTINATION, PegName.AUXILIARY)
         
         print(f"Generated {len(moves)} moves")
         print(f"Expected {(2**n) - 1} moves")
@@ -23,13 +28,14 @@ def test_hanoi_algorithm():
         # Verify correct number of moves
         assert len(moves) == (2**n) - 1, f"Wrong number of moves for {n} disks"
         
-        # Execute all moves
-        for i, move in enumerate(moves):
-            success = game_state.execute_move(move)
-            if not success:
-                print(f"Failed to execute move {i+1}: {move}")
-                print(f"Game state: {game_state.pegs}")
-                return False
+        # Check every move is legal, once, on the validating path
+        if not validate_move_sequence(moves, n):
+            print(f"✗ Illegal move sequence for {n} disks")
+            return False
+        
+        # Execute all moves on the trusted fast path
+        for move in moves:
+            game_state.execute_move_unchecked(move)
         
         # Verify puzzle is solved
         if game_state.is_solved():
@@ -42,5 +48,33 @@ def test_hanoi_algorithm():
     print("\n✓ All tests passed!")
     return True
 
+def reference_solver(n, source, destination, auxiliary):
+    """Textbook recursive solution used as the reference sequence."""
+    if n == 0:
+        return []
+    return (reference_solver(n - 1, source, auxiliary, destination) +
+            [Move(n, source, destination)] +
+            reference_solver(n - 1, auxiliary, destination, source))
+
+def test_solver_matches_reference():
+    """Test hanoi_moves builds the textbook sequence for every peg order."""
+    
+    for n in range(1, 9):
+        for source, destination, auxiliary in permutations(PegName):
+            expected = reference_solver(n, source, destination, auxiliary)
+            built = hanoi_moves(n, source, destination, auxiliary)
+            assert built == expected, f"Built list mismatch for {n} disks {source} -> {destination}"
+            
+            # Prime the cache with plain ints, which hash equal to PegName members
+            get_hanoi_moves(n, int(source), int(destination), int(auxiliary))
+            cached = get_hanoi_moves(n, source, destination, auxiliary)
+            assert cached == tuple(expected), f"Cached tuple mismatch for {n} disks {source} -> {destination}"
+            assert get_hanoi_moves(n, source, destination, auxiliary) is cached, "Solution was not cached"
+            assert isinstance(cached[0].from_peg, PegName), "Cached moves must hold PegName members"
+    
+    print("✓ Move builder and cache match the recursive reference for all peg orders")
+    return True
+
 if __name__ == "__main__":
-    test_hanoi_algorithm()
\ No newline at end of file
+    test_hanoi_algorithm()
+    test_solver_matches_reference()
\ No newline at end of file
@@ -2,8 +2,9 @@
 """
 Tower of Hanoi Visual Solver
 
-A Python-based visual Tower of Hanoi solver that demonstrates the classic
-recursive algorithm through an animated GUI interface using tkinter.
+A Python-based visual Tower of Hanoi solver that animates the optimal move
+sequence of the classic recursive algorithm through a tkinter GUI. The moves
+are built bottom-up from smaller solutions, so no recursion is used.
 
 This application solves the Tower of Hanoi puzzle for 3-10 disks with
 colour-blind accessible visual design and smooth animations.
@@ -11,44 +12,55 @@ colour-blind accessible visual design and smooth animations.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Generator
-from enum import Enum
-import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from enum import IntEnum
+import functools
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('tower_of_hanoi.log'),
-        logging.StreamHandler()
-    ]
-)
+# Logging is configured by main(); importing the module (e.g. from the
+# tests) leaves handlers alone and opens no log file
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
-class PegName(Enum):
-    """Enumeration for the three pegs in Tower of Hanoi."""
-    SOURCE = "A"
-    AUXILIARY = "B" 
-    DESTINATION = "C"
+class PegName(IntEnum):
+    """
+    Enumeration for the three pegs in Tower of Hanoi.
+    
+    Members are plain ints (0, 1, 2) so they can index peg lists directly;
+    PEG_LABELS gives the display letter for each.
+    """
+    SOURCE = 0
+    AUXILIARY = 1
+    DESTINATION = 2
+
+
+# Display labels indexed by PegName
+PEG_LABELS = ("A", "B", "C")
+
+# Largest puzzle whose solution get_hanoi_moves keeps cached (4,095 moves)
+MAX_CACHED_DISKS = 12
 
 
-@dataclass
-class Move:
-    """Represents a single disk movement in the Tower of Hanoi solution."""
+class Move(NamedTuple):
+    """
+    Represents a single disk movement in the Tower of Hanoi solution.
+    
+    A named tuple rather than a dataclass: it is immutable, cheaper to
+    create and store, and unpacks as (disk_size, from_peg, to_peg).
+    """
     disk_size: int
     from_peg: PegName
     to_peg: PegName
     
     def __str__(self) -> str:
-        return f"Move disk {self.disk_size} from {self.from_peg.value} to {self.to_peg.value}"
+        return f"Move disk {self.disk_size} from {PEG_LABELS[self.from_peg]} to {PEG_LABELS[self.to_peg]}"
 
 
 class Disk:
-    """Represents a disk in the Tower of Hanoi puzzle."""
+    """Visual attributes of a disk, used only when drawing the puzzle."""
+    
+    __slots__ = ("size", "colour", "x", "y")
     
     def __init__(self, size: int, colour: str):
         self.size = size
@@ -61,24 +73,31 @@ class Disk:
 
 
 class Peg:
-    """Represents a peg that holds disks in the Tower of Hanoi puzzle."""
+    """
+    Represents a peg that holds disks in the Tower of Hanoi puzzle.
+    
+    Disks are stored as plain integer sizes, bottom first; their visual
+    attributes live separately in GameState.disk_visuals.
+    """
+    
+    __slots__ = ("name", "disks")
     
     def __init__(self, name: PegName):
         self.name = name
-        self.disks: List[Disk] = []
+        self.disks: List[int] = []
         
-    def push(self, disk: Disk) -> None:
+    def push(self, disk_size: int) -> None:
         """Add a disk to the top of this peg."""
-        if self.disks and disk.size >= self.disks[-1].size:
-            raise ValueError(f"Cannot place disk {disk.size} on smaller disk {self.disks[-1].size}")
-        self.disks.append(disk)
+        if self.disks and disk_size >= self.disks[-1]:
+            raise ValueError(f"Cannot place disk {disk_size} on smaller disk {self.disks[-1]}")
+        self.disks.append(disk_size)
         
-    def pop(self) -> Optional[Disk]:
-        """Remove and return the top disk from this peg."""
+    def pop(self) -> Optional[int]:
+        """Remove and return the size of the top disk on this peg."""
         return self.disks.pop() if self.disks else None
         
-    def peek(self) -> Optional[Disk]:
-        """Return the top disk without removing it."""
+    def peek(self) -> Optional[int]:
+        """Return the size of the top disk without removing it."""
         return self.disks[-1] if self.disks else None
         
     def is_empty(self) -> bool:
@@ -90,23 +109,21 @@ class Peg:
         return len(self.disks)
         
     def __repr__(self) -> str:
-        return f"Peg({self.name.value}: {[d.size for d in self.disks]})"
+        return f"Peg({PEG_LABELS[self.name]}: {self.disks})"
 
 
 class GameState:
     """Manages the current state of the Tower of Hanoi puzzle."""
     
+    __slots__ = ("num_disks", "total_moves", "current_move", "pegs", "colours", "disk_visuals")
+    
     def __init__(self, num_disks: int):
         self.num_disks = num_disks
         self.total_moves = (2 ** num_disks) - 1
         self.current_move = 0
         
-        # Create pegs
-        self.pegs = {
-            PegName.SOURCE: Peg(PegName.SOURCE),
-            PegName.AUXILIARY: Peg(PegName.AUXILIARY), 
-            PegName.DESTINATION: Peg(PegName.DESTINATION)
-        }
+        # Create pegs, indexed by PegName; the set of pegs never changes
+        self.pegs: Tuple[Peg, Peg, Peg] = (Peg(PegName.SOURCE), Peg(PegName.AUXILIARY), Peg(PegName.DESTINATION))
         
         # Colour palette for colour-blind accessibility
         self.colours = [
@@ -122,67 +139,91 @@ class GameState:
             "#BD10E0"   # Magenta
         ]
         
+        # Visual attributes per disk size, only consulted when drawing
+        self.disk_visuals: Dict[int, Disk] = {
+            i: Disk(i, self.colours[i - 1] if i <= len(self.colours) else "#CCCCCC")
+            for i in range(1, num_disks + 1)
+        }
+        
         # Initialize disks on source peg (largest at bottom)
         for i in range(num_disks, 0, -1):
-            colour = self.colours[i - 1] if i <= len(self.colours) else "#CCCCCC"
-            disk = Disk(i, colour)
-            self.pegs[PegName.SOURCE].push(disk)
+            self.pegs[PegName.SOURCE].push(i)
             
     def execute_move(self, move: Move) -> bool:
         """Execute a move and return True if successful."""
-        from_peg = self.pegs[move.from_peg]
-        to_peg = self.pegs[move.to_peg]
+        expected_size, from_index, to_index = move
+        
+        # Work on the raw stacks: their last entry is the top disk's size
+        from_disks = self.pegs[from_index].disks
+        to_disks = self.pegs[to_index].disks
         
-        if from_peg.is_empty():
-            logger.warning(f"Attempted to move from empty peg {move.from_peg.value}")
+        if not from_disks:
+            logger.warning("Attempted to move from empty peg %s", PEG_LABELS[from_index])
             return False
             
-        disk = from_peg.peek()
-        if disk is None or disk.size != move.disk_size:
-            logger.warning(f"Disk size mismatch: expected {move.disk_size}, found {disk.size if disk else None}")
+        disk_size = from_disks[-1]
+        if disk_size != expected_size:
+            logger.warning("Disk size mismatch: expected %d, found %d", expected_size, disk_size)
             return False
             
-        if not to_peg.is_empty() and to_peg.peek().size < disk.size:
-            logger.warning(f"Invalid move: cannot place disk {disk.size} on smaller disk {to_peg.peek().size}")
+        if to_disks and to_disks[-1] < disk_size:
+            logger.warning("Invalid move: cannot place disk %d on smaller disk %d", disk_size, to_disks[-1])
             return False
             
-        # Execute the move
-        moved_disk = from_peg.pop()
-        to_peg.push(moved_disk)
-        self.current_move += 1
+        self.execute_move_unchecked(move)
         
-        logger.debug(f"Move {self.current_move}: {move}")
+        # Called for every move, so only format the message when it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Move %d: %s", self.current_move, move)
         return True
         
+    def execute_move_unchecked(self, move: Move) -> None:
+        """
+        Execute a move without validating it.
+        
+        Only for moves known to be legal, such as those from hanoi_moves();
+        an illegal move here silently corrupts the state.
+        """
+        self.pegs[move.to_peg].disks.append(self.pegs[move.from_peg].disks.pop())
+        self.current_move += 1
+        
     def is_solved(self) -> bool:
-        """Check if the puzzle is solved (all disks on destination peg)."""
-        return (self.pegs[PegName.DESTINATION].size() == self.num_disks and
-                self.pegs[PegName.SOURCE].is_empty() and
-                self.pegs[PegName.AUXILIARY].is_empty())
+        """
+        Check if the puzzle is solved (all disks on destination peg).
+        
+        Disks are never created or destroyed, so the destination holding all
+        of them implies the other pegs are empty.
+        """
+        solved = len(self.pegs[PegName.DESTINATION].disks) == self.num_disks
+        assert not solved or (self.pegs[PegName.SOURCE].is_empty() and
+                              self.pegs[PegName.AUXILIARY].is_empty()), "Disk count invariant broken"
+        return solved
                 
     def reset(self) -> None:
         """Reset the puzzle to initial state."""
         # Clear all pegs
-        for peg in self.pegs.values():
+        for peg in self.pegs:
             peg.disks.clear()
             
         # Reinitialize disks on source peg
         for i in range(self.num_disks, 0, -1):
-            colour = self.colours[i - 1] if i <= len(self.colours) else "#CCCCCC"
-            disk = Disk(i, colour)
-            self.pegs[PegName.SOURCE].push(disk)
+            self.pegs[PegName.SOURCE].push(i)
             
         self.current_move = 0
 
 
-def hanoi_solver(n: int, source: PegName, destination: PegName, auxiliary: PegName) -> Generator[Move, None, None]:
+def hanoi_moves(n: int, source: PegName, destination: PegName, auxiliary: PegName) -> List[Move]:
     """
-    Generate the sequence of moves to solve Tower of Hanoi puzzle.
+    Build the complete list of moves to solve Tower of Hanoi puzzle.
     
-    This is the classic recursive algorithm:
-    1. Move n-1 disks from source to auxiliary peg
-    2. Move the largest disk from source to destination peg  
-    3. Move n-1 disks from auxiliary to destination peg
+    This is the same optimal sequence as the classic recursive algorithm
+    h(k, a, b, c) = h(k-1, a, c, b) + [move k from a to b] + h(k-1, c, b, a),
+    but built bottom-up with the tupling strategy instead of recursing twice
+    per level. Only three peg orderings are ever needed per level (the
+    rotations of either (source, destination, auxiliary) or (source,
+    auxiliary, destination), alternating by level), so each level is three
+    list concatenations done in C. Every level shares the same Move objects,
+    so only 3n of them are created however long the solution is.
     
     Args:
         n: Number of disks to move
@@ -190,20 +231,80 @@ def hanoi_solver(n: int, source: PegName, destination: PegName, auxiliary: PegNa
         destination: Target peg
         auxiliary: Helper peg
         
-    Yields:
-        Move objects representing each step in the solution
+    Returns:
+        List of Move objects in solution order
     """
+    if n < 1:
+        return []
+        
+    # Peg orderings (from, to, via) used on levels with the same and the
+    # opposite parity to n respectively
+    same_parity = ((source, destination, auxiliary),
+                   (destination, auxiliary, source),
+                   (auxiliary, source, destination))
+    opposite_parity = tuple((a, c, b) for a, b, c in same_parity)
+    
+    orderings = same_parity if n % 2 == 1 else opposite_parity
+    solutions = {(a, b, c): [Move(1, a, b)] for a, b, c in orderings}
+    
+    for k in range(2, n):
+        orderings = same_parity if (n - k) % 2 == 0 else opposite_parity
+        solutions = {
+            (a, b, c): solutions[(a, c, b)] + [Move(k, a, b)] + solutions[(c, b, a)]
+            for a, b, c in orderings
+        }
+        
     if n == 1:
-        yield Move(1, source, destination)
-    else:
-        # Move n-1 disks to auxiliary peg
-        yield from hanoi_solver(n - 1, source, auxiliary, destination)
+        return solutions[(source, destination, auxiliary)]
         
-        # Move the largest disk to destination
-        yield Move(n, source, destination)
+    # Top level: only the requested ordering is needed
+    return (solutions[(source, auxiliary, destination)] + [Move(n, source, destination)] +
+            solutions[(auxiliary, destination, source)])
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_hanoi_moves(n: int, source: PegName, destination: PegName, auxiliary: PegName) -> Tuple[Move, ...]:
+    """Memoised hanoi_moves(), frozen into a tuple so it can be shared safely."""
+    return tuple(hanoi_moves(n, source, destination, auxiliary))
+
+
+def get_hanoi_moves(n: int, source: PegName, destination: PegName, auxiliary: PegName) -> Tuple[Move, ...]:
+    """
+    Return the complete solution as a tuple, reusing earlier results.
+    
+    Solutions are deterministic, so repeated requests for the same puzzle
+    (for example Reset followed by Start in the GUI) return the cached
+    tuple instead of rebuilding it. Only puzzles of up to MAX_CACHED_DISKS
+    disks are cached, to keep the cache small. Takes the same arguments
+    and gives the same moves as hanoi_moves().
+    """
+    # Moves must hold PegName members even if called with plain ints (which
+    # IntEnum members hash equal to, so could otherwise share a cache entry)
+    source, destination, auxiliary = PegName(source), PegName(destination), PegName(auxiliary)
+    if n > MAX_CACHED_DISKS:
+        return tuple(hanoi_moves(n, source, destination, auxiliary))
+    return _cached_hanoi_moves(n, source, destination, auxiliary)
+
+
+def validate_move_sequence(moves: Iterable[Move], num_disks: int) -> bool:
+    """
+    Check that a sequence of moves legally solves a puzzle.
+    
+    Replays the moves on a fresh GameState with full validation, so any
+    illegal move is logged as a warning.
+    
+    Args:
+        moves: Moves to check, in order
+        num_disks: Number of disks in the puzzle
         
-        # Move n-1 disks from auxiliary to destination
-        yield from hanoi_solver(n - 1, auxiliary, destination, source)
+    Returns:
+        True if every move is legal and the puzzle ends up solved
+    """
+    game_state = GameState(num_disks)
+    for move in moves:
+        if not game_state.execute_move(move):
+            return False
+    return game_state.is_solved()
 
 
 class TowerOfHanoiGUI:
@@ -217,12 +318,25 @@ class TowerOfHanoiGUI:
         
         # Game state
         self.game_state: Optional[GameState] = None
-        self.move_generator: Optional[Generator[Move, None, None]] = None
+        self.moves: Tuple[Move, ...] = ()  # Full solution, fetched when solving starts
+        self.move_index = 0  # Index of the next move to play
         self.is_solving = False
         self.is_paused = False
         self.animation_speed = 500  # milliseconds between moves
         self.current_move: Optional[Move] = None  # Track current move for highlighting
         
+        # Canvas items per disk size: (rectangle, shadow, label) ids
+        self.disk_items: Dict[int, Tuple[int, int, int]] = {}
+        self.highlighted_disk: Optional[int] = None
+        
+        # Layout cache, filled by _update_geometry on each full repaint
+        self._base_y = 0.0
+        self._peg_height = 0
+        self._base_width = 0.0
+        self._peg_centers: List[float] = []
+        self._disk_height = 0
+        self._disk_geom: List[Tuple[float, float]] = []
+        
         # GUI components
         self.setup_gui()
         
@@ -290,6 +404,7 @@ class TowerOfHanoiGUI:
         # Canvas for drawing
         self.canvas = tk.Canvas(main_frame, bg="white", relief=tk.SUNKEN, borderwidth=2)
         self.canvas.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.canvas.bind("<Configure>", lambda e: self.draw_puzzle())
         
         # Initialize with 3 disks
         self.reset_puzzle()
@@ -313,7 +428,9 @@ class TowerOfHanoiGUI:
                 return
                 
             self.game_state = GameState(num_disks)
-            self.move_generator = hanoi_solver(num_disks, PegName.SOURCE, PegName.DESTINATION, PegName.AUXILIARY)
+            self.moves = get_hanoi_moves(num_disks, PegName.SOURCE, PegName.DESTINATION, PegName.AUXILIARY)
+            self.move_index = 0
+            self.draw_puzzle()
             self.is_solving = True
             self.is_paused = False
             
@@ -326,7 +443,6 @@ class TowerOfHanoiGUI:
             self.is_paused = False
             self.pause_button.config(text="Pause")
             
-        self.draw_puzzle()
         self.next_move()
         
     def toggle_pause(self) -> None:
@@ -386,28 +502,26 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
         if not self.is_solving or self.is_paused:
             return
             
-        try:
-            move = next(self.move_generator)
-            self.current_move = move  # Store for highlighting
-            success = self.game_state.execute_move(move)
+        if self.move_index >= len(self.moves):
+            self.finish_solving()
+            return
             
-            if success:
-                self.draw_puzzle()
-                self.update_status()
-                
-                if self.game_state.is_solved():
-                    self.current_move = None
-                    self.finish_solving()
-                else:
-                    # Schedule next move
-                    self.root.after(self.animation_speed, self.next_move)
-            else:
-                messagebox.showerror("Error", f"Invalid move: {move}")
-                self.current_move = None
+        move = self.moves[self.move_index]
+        self.move_index += 1
+        self.current_move = move  # Store for highlighting
+        success = self.game_state.execute_move(move)
+        
+        if success:
+            self._apply_move(move)
+            self.update_status()
+            
+            if self.game_state.is_solved():
                 self.finish_solving()
-                
-        except StopIteration:
-            self.current_move = None
+            else:
+                # Schedule next move
+                self.root.after(self.animation_speed, self.next_move)
+        else:
+            messagebox.showerror("Error", f"Invalid move: {move}")
             self.finish_solving()
             
     def finish_solving(self) -> None:
@@ -415,6 +529,10 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
         self.is_solving = False
         self.is_paused = False
         
+        # Nothing is moving any more, so clear the highlight
+        self.current_move = None
+        self._set_highlight(None)
+        
         # Update button states
         self.start_button.config(state="normal")
         self.pause_button.config(state="disabled", text="Pause")
@@ -463,12 +581,19 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
             self.status_label.config(text="Ready to start")
             
     def draw_puzzle(self) -> None:
-        """Draw the current puzzle state on the canvas."""
+        """
+        Repaint the whole canvas, creating one set of items per disk.
+        
+        Only needed when the puzzle is reset or started, or the canvas is
+        resized; individual moves are animated by _apply_move().
+        """
+        self.canvas.delete("all")
+        self.disk_items = {}
+        self.highlighted_disk = None
+        
         if not self.game_state:
             return
             
-        self.canvas.delete("all")
-        
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
         
@@ -477,25 +602,16 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
             self.root.after(100, self.draw_puzzle)
             return
             
-        # Calculate dimensions
-        peg_width = canvas_width // 3
-        peg_height = canvas_height - 100
-        base_y = canvas_height - 50
-        
-        max_disk_size = self.game_state.num_disks
-        max_disk_width = peg_width * 0.8
-        disk_height = min(peg_height // (max_disk_size + 2), 30)
+        self._update_geometry(canvas_width, canvas_height)
+        base_y = self._base_y
+        peg_height = self._peg_height
+        base_width = self._base_width
         
         # Draw pegs and bases
-        peg_names = [PegName.SOURCE, PegName.AUXILIARY, PegName.DESTINATION]
-        peg_centers = []
-        
-        for i, peg_name in enumerate(peg_names):
-            center_x = (i + 0.5) * peg_width
-            peg_centers.append(center_x)
+        for peg_name in PegName:
+            center_x = self._peg_centers[peg_name]
             
             # Draw base
-            base_width = peg_width * 0.9
             self.canvas.create_rectangle(
                 center_x - base_width/2, base_y - 10,
                 center_x + base_width/2, base_y + 10,
@@ -513,51 +629,112 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
             # Draw peg label
             self.canvas.create_text(
                 center_x, base_y + 30,
-                text=peg_name.value, font=("Arial", 14, "bold")
+                text=PEG_LABELS[peg_name], font=("Arial", 14, "bold")
             )
             
-        # Draw disks
-        for i, peg_name in enumerate(peg_names):
-            peg = self.game_state.pegs[peg_name]
-            center_x = peg_centers[i]
-            
-            for j, disk in enumerate(peg.disks):
-                disk_width = (disk.size / max_disk_size) * max_disk_width
-                disk_y = base_y - (j + 1) * disk_height
-                
-                # Check if this disk is currently moving
-                is_moving = (self.current_move and 
-                           disk.size == self.current_move.disk_size and
-                           j == len(peg.disks) - 1 and  # Only highlight top disk
-                           peg_name == self.current_move.from_peg)
+        # Draw disks, bottom first so upper disks' shadows overlap lower disks
+        for peg_name in PegName:
+            for j, disk_size in enumerate(self.game_state.pegs[peg_name].disks):
+                disk = self.game_state.disk_visuals[disk_size]
                 
-                # Draw disk with shadow effect
-                shadow_offset = 3
-                self.canvas.create_rectangle(
-                    center_x - disk_width/2 + shadow_offset,
-                    disk_y - disk_height/2 + shadow_offset,
-                    center_x + disk_width/2 + shadow_offset,
-                    disk_y + disk_height/2 + shadow_offset,
-                    fill="#000000", stipple="gray25", outline=""
+                # Disk with shadow effect; coordinates are set by _place_disk
+                shadow_id = self.canvas.create_rectangle(
+                    0, 0, 0, 0, fill="#000000", stipple="gray25", outline=""
                 )
-                
-                # Draw main disk with highlighting if moving
-                outline_colour = "#FF6B6B" if is_moving else "#333333"
-                outline_width = 4 if is_moving else 2
-                
-                self.canvas.create_rectangle(
-                    center_x - disk_width/2, disk_y - disk_height/2,
-                    center_x + disk_width/2, disk_y + disk_height/2,
-                    fill=disk.colour, outline=outline_colour, width=outline_width
+                rect_id = self.canvas.create_rectangle(
+                    0, 0, 0, 0, fill=disk.colour, outline="#333333", width=2
                 )
                 
                 # Add disk size label
-                font_weight = "bold" if is_moving else "normal"
-                self.canvas.create_text(
-                    center_x, disk_y,
-                    text=str(disk.size), font=("Arial", 10, font_weight)
+                text_id = self.canvas.create_text(
+                    0, 0, text=str(disk.size), font=("Arial", 10, "normal")
                 )
                 
+                self.disk_items[disk_size] = (rect_id, shadow_id, text_id)
+                self._place_disk(disk_size, peg_name, j)
+                
+        if self.current_move is not None:
+            self._set_highlight(self.current_move.disk_size)
+            
+    def _apply_move(self, move: Move) -> None:
+        """
+        Show a move that has just been executed on the game state.
+        
+        Only the moved disk's items are repositioned and only the highlight
+        outlines change, so each animation step costs a fixed handful of
+        canvas operations whatever the number of disks.
+        """
+        if move.disk_size not in self.disk_items:
+            # Canvas not drawn yet; the pending repaint will show this state
+            return
+            
+        level = self.game_state.pegs[move.to_peg].size() - 1
+        self._place_disk(move.disk_size, move.to_peg, level)
+        self._set_highlight(move.disk_size)
+        
+    def _update_geometry(self, canvas_width: int, canvas_height: int) -> None:
+        """
+        Recompute the cached layout for the current canvas size and disk count.
+        
+        Called on every full repaint (reset, start and canvas resize), which
+        are the only times the layout can change; draw_puzzle and _place_disk
+        read the cache.
+        """
+        peg_width = canvas_width // 3
+        peg_height = canvas_height - 100
+        max_disk_size = self.game_state.num_disks
+        max_disk_width = peg_width * 0.8
+        
+        self._base_y = canvas_height - 50
+        self._peg_height = peg_height
+        self._base_width = peg_width * 0.9
+        self._peg_centers = [(i + 0.5) * peg_width for i in PegName]
+        self._disk_height = min(peg_height // (max_disk_size + 2), 30)
+        
+        # (width, half width) per disk size; index 0 is unused
+        self._disk_geom = [(0.0, 0.0)]
+        for size in range(1, max_disk_size + 1):
+            disk_width = (size / max_disk_size) * max_disk_width
+            self._disk_geom.append((disk_width, disk_width / 2))
+            
+    def _place_disk(self, disk_size: int, peg_name: PegName, level: int) -> None:
+        """Move a disk's canvas items to the given level (0 = bottom) of a peg."""
+        center_x = self._peg_centers[peg_name]
+        disk_height = self._disk_height
+        half_width = self._disk_geom[disk_size][1]
+        disk_y = self._base_y - (level + 1) * disk_height
+        
+        x1, y1 = center_x - half_width, disk_y - disk_height/2
+        x2, y2 = center_x + half_width, disk_y + disk_height/2
+        shadow_offset = 3
+        
+        rect_id, shadow_id, text_id = self.disk_items[disk_size]
+        self.canvas.coords(shadow_id, x1 + shadow_offset, y1 + shadow_offset,
+                           x2 + shadow_offset, y2 + shadow_offset)
+        self.canvas.coords(rect_id, x1, y1, x2, y2)
+        self.canvas.coords(text_id, center_x, disk_y)
+        
+        # The disk is now the top of its peg, so it must sit above the others
+        for item_id in (shadow_id, rect_id, text_id):
+            self.canvas.tag_raise(item_id)
+            
+    def _set_highlight(self, disk_size: Optional[int]) -> None:
+        """Outline the given disk as moving, clearing the previous highlight."""
+        if disk_size == self.highlighted_disk:
+            return
+            
+        if self.highlighted_disk is not None:
+            rect_id, _, text_id = self.disk_items[self.highlighted_disk]
+            self.canvas.itemconfig(rect_id, outline="#333333", width=2)
+            self.canvas.itemconfig(text_id, font=("Arial", 10, "normal"))
+            
+        if disk_size is not None:
+            rect_id, _, text_id = self.disk_items[disk_size]
+            self.canvas.itemconfig(rect_id, outline="#FF6B6B", width=4)
+            self.canvas.itemconfig(text_id, font=("Arial", 10, "bold"))
+            
+        self.highlighted_disk = disk_size
+                
     def run(self) -> None:
         """Start the GUI event loop."""
         # Force initial canvas update
@@ -568,6 +745,14 @@ The algorithm uses 2^n - 1 moves for n disks (optimal solution)."""
 
 def main() -> None:
     """Main entry point for the application."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('tower_of_hanoi.log'),
+            logging.StreamHandler()
+        ]
+    )
     app = TowerOfHanoiGUI()
     app.run()
 